@@ -1,6 +1,22 @@
-from pydantic import BaseModel, Field, conlist
-from typing import List, Dict, Any, Union, Optional
+from pydantic import BaseModel, Field, PrivateAttr, conlist
+from typing import List, Dict, Any, Union, Optional, Iterator, Tuple, Callable
+from collections.abc import Sequence
+import functools
 import math
+from dataclasses import dataclass
+import numpy as np
+
+try:
+    from numba import njit, prange, vectorize
+except ImportError:  # Numba is optional; the NumPy kernels below are used without it
+    njit = prange = vectorize = None
+
+try:
+    from rtree import index as rtree_index
+except ImportError:  # rtree is optional; large layouts then fall back to the linear box scan
+    rtree_index = None
+
+MPH_TO_MPS = 0.44704
 
 # ======================================================================
 # 1. Data Models for AMANDA's Constraints (Refactored Digital Section)
@@ -29,6 +45,249 @@ class DigitalConstraintData(BaseModel):
     # Raw touch data now includes the component the application *thought* was touched.
     raw_touch_data: List[Dict[str, Union[int, str, bool]]] = Field(..., description="List of recorded user touches: {'x', 'y', 'event_fired', 'component_id_detected'}.")
 
+    # Struct-of-Arrays view of raw_touch_data and the precomputed layout, built at construction
+    _derived: Optional["_DigitalState"] = PrivateAttr(None)
+
+    @classmethod
+    def trusted(cls, **fields: Any) -> "DigitalConstraintData":
+        """
+        Builds the model without field validation, for producers already known to emit
+        well-formed data. app_components must already be ApplicationComponent instances.
+        """
+        return cls.model_construct(**fields)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._sync_derived()
+
+    def _sync_derived(self) -> "_DigitalState":
+        """
+        The derived state, rebuilt first if raw_touch_data / app_components has been
+        reassigned or resized since it was built (e.g. by model_copy(update=...) or an
+        append). Edits to existing touches or components in place are not tracked.
+        """
+        # Read through __pydantic_private__: self._derived would go through BaseModel.__getattr__,
+        # which costs microseconds per read
+        state = self.__pydantic_private__['_derived']
+        touches, components = self.raw_touch_data, self.app_components
+        touches_stale = state is None or touches is not state.touches or len(touches) != state.xs.shape[0]
+        components_stale = (
+            state is None or components is not state.components or len(components) != len(state.layout.component_ids)
+        )
+        if touches_stale or components_stale:
+            columns = _stack_touches(touches) if touches_stale else (state.xs, state.ys, state.fired)
+            layout = _digital_layout(components) if components_stale else state.layout
+            # A new holder rather than an update in place, as model_copy shares it with the copy
+            self._derived = state = _DigitalState(touches, components, *columns, layout)
+        return state
+
+    @property
+    def touch_xs(self) -> np.ndarray:
+        """X coordinate of every touch, in recording order."""
+        return self._sync_derived().xs
+
+    @property
+    def touch_ys(self) -> np.ndarray:
+        """Y coordinate of every touch, in recording order."""
+        return self._sync_derived().ys
+
+    @property
+    def touch_events_fired(self) -> np.ndarray:
+        """Whether the application fired an event for each touch."""
+        return self._sync_derived().fired
+
+    @property
+    def layout(self) -> "_DigitalLayout":
+        """The precomputed form of app_components used by the analysis."""
+        return self._sync_derived().layout
+
+    @property
+    def component_bounds(self) -> np.ndarray:
+        """(M, 4) array of [xmin, ymin, xmax, ymax] per component, in definition order."""
+        return self.layout.bounds
+
+    @property
+    def component_extent(self) -> np.ndarray:
+        """[xmin, ymin, xmax, ymax] of the union of all component bounding boxes."""
+        return self.layout.extent
+
+    @property
+    def component_ids(self) -> Tuple[str, ...]:
+        """component_id per component, parallel to the rows of component_bounds."""
+        return self.layout.component_ids
+
+    @property
+    def expected_event_types(self) -> Tuple[str, ...]:
+        """expected_event_type per component, parallel to the rows of component_bounds."""
+        return self.layout.expected_event_types
+
+def _stack_touches(touches: List[Dict[str, Union[int, str, bool]]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Struct-of-Arrays (x, y, event_fired) view of a list of recorded touches. Coordinates are
+    packed as int16 when they all fit (screen pixels nearly always do), otherwise int64.
+    """
+    n_touches = len(touches)
+    for dtype in (np.int16, np.int64):
+        try:
+            xs = np.fromiter((touch['x'] for touch in touches), dtype=dtype, count=n_touches)
+            ys = np.fromiter((touch['y'] for touch in touches), dtype=dtype, count=n_touches)
+            break
+        except OverflowError:
+            continue
+    else:
+        # The coordinates are unbounded ints; values beyond int64 are compared as exact Python ints
+        xs = np.array([touch['x'] for touch in touches], dtype=object)
+        ys = np.array([touch['y'] for touch in touches], dtype=object)
+    fired = np.fromiter((bool(touch['event_fired']) for touch in touches), dtype=bool, count=n_touches)
+    return xs, ys, fired
+
+class _DigitalState:
+    """
+    Derived state of one DigitalConstraintData: its touches as parallel arrays, its layout,
+    and the field values both were built from. Replaced, never mutated, when those change.
+    """
+    __slots__ = ("touches", "components", "xs", "ys", "fired", "layout")
+    # Derived from the model's fields, which model equality already compares; comparing the
+    # arrays here would make == raise on any batch of two or more touches
+    __hash__ = None
+
+    def __init__(self, touches, components, xs: np.ndarray, ys: np.ndarray, fired: np.ndarray, layout: "_DigitalLayout"):
+        self.touches, self.components = touches, components
+        self.xs, self.ys, self.fired = xs, ys, fired
+        self.layout = layout
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _DigitalState)
+
+class _DigitalLayout:
+    """
+    Immutable, precomputed form of one application layout: component bounds and their
+    union extent, interned component ids, and the per-component fields directives quote.
+    Built once per distinct layout and shared by every model that uses it.
+    """
+    __slots__ = (
+        "component_ids", "expected_event_types", "bounds", "extent", "id_codes", "detected_lookup", "component_codes",
+        "scan_order", "scan_components", "scan_bounds", "scan_codes", "scan_bounds16", "extent16", "spatial_index"
+    )
+
+    def __init__(self, spec: Tuple[Tuple[str, Tuple[int, ...], str], ...]):
+        self.component_ids = tuple(component_id for component_id, _, _ in spec)
+        self.expected_event_types = tuple(event_type for _, _, event_type in spec)
+
+        try:
+            bounds = np.asarray([box for _, box, _ in spec], dtype=np.int64).reshape(-1, 4)
+        except OverflowError:
+            # Box edges beyond int64 are kept as exact Python ints (hit-tested by the NumPy path)
+            bounds = np.asarray([box for _, box, _ in spec], dtype=object).reshape(-1, 4)
+        if bounds.shape[0]:
+            extent = np.concatenate((bounds[:, :2].min(axis=0), bounds[:, 2:].max(axis=0)))
+        else:
+            # An empty (inverted) extent: every touch falls outside it
+            extent = np.array([0, 0, -1, -1], dtype=np.int64)
+
+        # Intern component ids to small ints so the mismatch test is an integer compare
+        id_codes: Dict[str, int] = {}
+        for component_id in self.component_ids:
+            id_codes.setdefault(component_id, len(id_codes))
+        component_codes = np.fromiter(
+            (id_codes[component_id] for component_id in self.component_ids), dtype=np.int64, count=len(spec)
+        )
+
+        # Boxes as the kernels scan them. When no two boxes share a point, at most one can
+        # contain a touch and the scan order is free: the largest (most likely hit) boxes go
+        # first so the compiled kernel's early exit fires sooner. Overlapping layouts keep
+        # definition order, where the first listed component wins.
+        scan_order = None
+        m = bounds.shape[0]
+        if 2 <= m <= _AREA_ORDER_MAX_COMPONENTS and bounds.dtype != object and not _boxes_overlap(bounds):
+            area = (bounds[:, 2] - bounds[:, 0]).astype(np.float64) * (bounds[:, 3] - bounds[:, 1])
+            order = np.argsort(-area, kind='stable')
+            if (order != np.arange(m)).any():
+                scan_order = order
+        scan_components = None
+        if scan_order is None:
+            scan_bounds, scan_codes = bounds, component_codes
+        else:
+            scan_bounds, scan_codes = bounds[scan_order], component_codes[scan_order]
+            # Component index per scan position; the trailing -1 maps a dead-space -1 to itself,
+            # so mapping hits back is a single gather
+            scan_components = np.append(scan_order, -1)
+
+        # int16 copies for int16-packed touches, so the compares stay at the narrow width
+        scan_bounds16 = extent16 = None
+        int16 = np.iinfo(np.int16)
+        if bounds.size == 0 or (bounds.min() >= int16.min and bounds.max() <= int16.max):
+            scan_bounds16, extent16 = scan_bounds.astype(np.int16), extent.astype(np.int16)
+
+        # The arrays are shared through the layout cache, so freeze them
+        for array in (
+            bounds, extent, component_codes, scan_order, scan_components, scan_bounds, scan_codes, scan_bounds16, extent16
+        ):
+            if array is not None:
+                array.flags.writeable = False
+        self.bounds, self.extent = bounds, extent
+        self.id_codes, self.component_codes = id_codes, component_codes
+        # id_codes plus the falsy reports (None, '', 0 / False) that mean "nothing detected",
+        # so coding a touch is a single dict lookup
+        self.detected_lookup = {**id_codes, None: _NO_DETECTED_ID, '': _NO_DETECTED_ID, 0: _NO_DETECTED_ID}
+        self.scan_order, self.scan_components = scan_order, scan_components
+        self.scan_bounds, self.scan_codes = scan_bounds, scan_codes
+        self.scan_bounds16, self.extent16 = scan_bounds16, extent16
+
+        # Large layouts get a bulk-loaded (packed) R-tree over the boxes, so hit-testing
+        # is O(log M) per touch instead of a scan over every component.
+        self.spatial_index = None
+        if rtree_index is not None and bounds.shape[0] >= _SPATIAL_INDEX_MIN_COMPONENTS and _float64_exact(bounds):
+            # Inverted boxes can never contain a touch (and the R-tree rejects them)
+            valid = (bounds[:, 0] <= bounds[:, 2]) & (bounds[:, 1] <= bounds[:, 3])
+            # Bulk loading rejects an empty stream; with no valid box the linear scan finds no hits
+            if valid.any():
+                self.spatial_index = rtree_index.Index(
+                    (j, tuple(bounds[j].tolist()), None) for j in np.flatnonzero(valid).tolist()
+                )
+
+    def boxes_for(self, coordinate_dtype: np.dtype) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (bounds, extent) in scan order, at the touches' coordinate width when the boxes fit
+        it, else int64. Pair the bounds with scan_codes, and map hit indices back through
+        scan_order (when set) to get component indices.
+        """
+        if coordinate_dtype == np.int16 and self.scan_bounds16 is not None:
+            return self.scan_bounds16, self.extent16
+        return self.scan_bounds, self.extent
+
+    def detected_codes(self, touches: List[Dict[str, Union[int, str, bool]]]) -> np.ndarray:
+        """Interned code of the component each touch reported (or _UNKNOWN_ID / _NO_DETECTED_ID)."""
+        code_of = self.detected_lookup.get
+        return np.fromiter(
+            (code_of(touch.get('component_id_detected'), _UNKNOWN_ID) for touch in touches),
+            dtype=np.int64, count=len(touches)
+        )
+
+def _float64_exact(values: np.ndarray) -> bool:
+    """Whether every value of an integer array converts to float64 without rounding."""
+    if values.dtype != object and values.dtype.itemsize < 8:
+        return True
+    return values.size == 0 or bool(-_FLOAT64_EXACT_INT <= values.min() and values.max() <= _FLOAT64_EXACT_INT)
+
+def _boxes_overlap(bounds: np.ndarray) -> bool:
+    """Whether any two of the (closed) boxes share a point; inverted boxes contain none."""
+    boxes = bounds[(bounds[:, 0] <= bounds[:, 2]) & (bounds[:, 1] <= bounds[:, 3])]
+    x_min, y_min, x_max, y_max = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    meet = ((x_min[:, None] <= x_max) & (x_min <= x_max[:, None])
+            & (y_min[:, None] <= y_max) & (y_min <= y_max[:, None]))
+    np.fill_diagonal(meet, False)
+    return bool(meet.any())
+
+def _digital_layout(components: List[ApplicationComponent]) -> _DigitalLayout:
+    """Returns the shared _DigitalLayout for a list of components, building it on first use."""
+    return _cached_digital_layout(tuple(
+        (comp.component_id, tuple(comp.bounding_box), comp.expected_event_type) for comp in components
+    ))
+
+@functools.lru_cache(maxsize=128)
+def _cached_digital_layout(spec: Tuple[Tuple[str, Tuple[int, ...], str], ...]) -> _DigitalLayout:
+    return _DigitalLayout(spec)
+
 # --- END REFACTORED DIGITAL CONSTRAINTS MODELS ---
 
 class PhysicalConstraintData(BaseModel):
@@ -39,6 +298,11 @@ class PhysicalConstraintData(BaseModel):
     door_coords_m: conlist(float, min_length=2, max_length=2) = Field(..., description="[x, y] coordinates of the target door.")
     user_velocity_mps: conlist(float, min_length=2, max_length=2) = Field(..., description="User's current [vx, vy] velocity in meters/sec.")
 
+    @classmethod
+    def trusted(cls, **fields: Any) -> "PhysicalConstraintData":
+        """Builds the model without field validation, for trusted telemetry producers."""
+        return cls.model_construct(**fields)
+
 class BaseConstitutionalLaw(BaseModel):
     """Base model for a Constitutional constraint (law) from a derived source."""
     source_constitution: str = Field(..., description="E.g., U.S. Constitution or Texas Constitution.")
@@ -47,6 +311,35 @@ class BaseConstitutionalLaw(BaseModel):
     speed_limit_mph: Optional[int] = Field(None, description="The speed limit defined by this specific law, if applicable.")
     zone_type: Optional[str] = Field(None, description="The type of zone this law applies to (e.g., School Zone).")
 
+@dataclass(frozen=True, slots=True)
+class _FastLaw:
+    """
+    Slotted runtime view of a BaseConstitutionalLaw holding only what the analysis reads,
+    including the report strings that depend on nothing but the law itself.
+    """
+    source_constitution: str
+    law_description: str
+    speed_limit_mph: int
+    limit_mps_sq: float
+    warning_mps: float
+    applied_law: str
+    speeding_directive: str
+
+    @classmethod
+    def from_spec(cls, speed_limit_mph: int, source_constitution: str, law_description: str) -> "_FastLaw":
+        """Builds the view from the only law fields it depends on."""
+        limit_mps = speed_limit_mph * MPH_TO_MPS
+        return cls(
+            source_constitution, law_description, speed_limit_mph, limit_mps**2,
+            # Pre-emptive warnings start at 95% of the limit
+            warning_mps=limit_mps * 0.95,
+            applied_law=f"Law from {source_constitution} ({law_description})",
+            speeding_directive=(
+                f"Immediate warning: **CURRENTLY EXCEEDING** the {speed_limit_mph} MPH limit "
+                f"imposed by {source_constitution} law."
+            )
+        )
+
 class ConstitutionalConstraintData(BaseModel):
     """Refactored data model for Constitutional Constraints (Speed Limit Example)."""
     geospatial_data: Dict[str, Any] = Field(..., description="Map data for the current area and zone.")
@@ -54,9 +347,410 @@ class ConstitutionalConstraintData(BaseModel):
     vehicle_speed_data_mph: float = Field(..., description="Current speed reported by the vehicle/radar.")
     vehicle_proximity_to_zone_m: float = Field(..., description="Distance to the enforcement zone boundary.")
     max_safe_decel_mps2: float = Field(..., description="Vehicle's maximum safe deceleration.")
+
+    @classmethod
+    def trusted(cls, **fields: Any) -> "ConstitutionalConstraintData":
+        """
+        Builds the model without field validation, for trusted telemetry producers.
+        applicable_laws must already be BaseConstitutionalLaw instances.
+        """
+        return cls.model_construct(**fields)
+
+    # Resolved from the current applicable_laws on each read, through a cache keyed by the
+    # laws' values: a new model per telemetry tick reuses the resolution, and a reassigned,
+    # extended or edited law list is never answered from stale state
+    @property
+    def speed_limits_mph(self) -> np.ndarray:
+        """Speed limits of the applicable laws that set one, in listing order."""
+        return _law_index(self.applicable_laws).speed_limits_mph
+
+    @property
+    def most_restrictive_law(self) -> Optional[_FastLaw]:
+        """Runtime view of the law with the lowest speed limit, or None if no law sets one."""
+        return _law_index(self.applicable_laws).most_restrictive_law
+
+class _LawIndex:
+    """
+    Immutable speed limits of one law list and a runtime view of its most restrictive law.
+    Built once per distinct list and shared by every model that uses it.
+    """
+    __slots__ = ("speed_limits_mph", "most_restrictive_law")
+
+    def __init__(self, spec: Tuple[Tuple[Optional[int], str, str], ...]):
+        speed_laws = [law for law in spec if law[0] is not None]
+        try:
+            speed_limits_mph = np.fromiter((law[0] for law in speed_laws), dtype=np.int64, count=len(speed_laws))
+        except OverflowError:
+            # The field is an unbounded int; limits beyond int64 are compared as exact Python ints
+            speed_limits_mph = np.array([law[0] for law in speed_laws], dtype=object)
+        # Shared through the cache, so freeze it
+        speed_limits_mph.flags.writeable = False
+        self.speed_limits_mph = speed_limits_mph
+        self.most_restrictive_law = None
+        if speed_laws:
+            # The first minimum is taken, so among equal limits the first listed law wins
+            self.most_restrictive_law = _FastLaw.from_spec(*speed_laws[_first_argmin(speed_limits_mph)])
+
+def _law_index(laws: List[BaseConstitutionalLaw]) -> _LawIndex:
+    """Returns the shared _LawIndex for a list of laws, building it on first use."""
+    return _cached_law_index(tuple(
+        (law.speed_limit_mph, law.source_constitution, law.law_description) for law in laws
+    ))
+
+@functools.lru_cache(maxsize=128)
+def _cached_law_index(spec: Tuple[Tuple[Optional[int], str, str], ...]) -> _LawIndex:
+    return _LawIndex(spec)
     
 # ======================================================================
-# 2. AMANDA Core Logic Class
+# 2. Regression Kernels
+# ======================================================================
+
+# Interned id codes for touches whose reported component is unknown / absent
+_UNKNOWN_ID = -1
+_NO_DETECTED_ID = -2
+
+# Per-touch status bits produced by the digital kernels (0 means a clean interaction)
+_OUT_OF_BOUNDS = 1
+_BOUNDARY_MISMATCH = 2
+_NO_EVENT_FIRED = 4
+
+# Upper bound on the cells of one broadcast (touches x components) hit mask
+_HIT_MASK_MAX_CELLS = 1 << 20
+
+# Magnitude up to which every integer has an exact float64 form (the R-tree's coordinate type)
+_FLOAT64_EXACT_INT = 1 << 53
+
+# Largest layout whose boxes are checked for overlap (an M x M test) to allow area ordering
+_AREA_ORDER_MAX_COMPONENTS = 1024
+
+# Layouts with at least this many components are hit-tested through an R-tree (if installed).
+# Each R-tree lookup costs a few microseconds, so the compiled linear scan stays ahead of it
+# for far larger layouts than the NumPy broadcast does.
+_SPATIAL_INDEX_MIN_COMPONENTS = 8192 if njit is not None else 512
+
+def _classify_touches_numpy(xs, ys, fired, detected_codes, boxes, extent, component_codes):
+    """
+    Hit-tests every touch against every component box with broadcast compares.
+    Returns the counters [valid, mismatch, no_event, out_of_bounds], the index of the
+    touched component per touch (-1 for dead space), the per-touch status bits and the
+    indices of the touches that carry any status bit (i.e. need a directive).
+    """
+    return _tally_touches(_hit_test_boxes(xs, ys, boxes, extent), fired, detected_codes, component_codes)
+
+def _classify_touches_indexed(xs, ys, fired, detected_codes, spatial_index, component_codes):
+    """_classify_touches_numpy, with the hit test answered by the layout's R-tree."""
+    return _tally_touches(_hit_test_indexed(xs, ys, spatial_index), fired, detected_codes, component_codes)
+
+def _hit_test_boxes(xs, ys, boxes, extent):
+    """Index of the first component box containing each touch, or -1 for dead space."""
+    touched = np.full(xs.shape[0], -1, dtype=np.int64)
+    if boxes.shape[0]:
+        # Touches outside the union extent of all boxes are dead space; a constant-time
+        # integer test drops them before the per-component compare.
+        x_lo, y_lo, x_hi, y_hi = extent
+        candidates = np.flatnonzero((xs >= x_lo) & (xs <= x_hi) & (ys >= y_lo) & (ys <= y_hi))
+        x_min, y_min, x_max, y_max = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+
+        # Candidates are hit-tested in row blocks so the (rows, M) mask stays bounded
+        # however many touches arrive in one batch.
+        step = max(1, _HIT_MASK_MAX_CELLS // boxes.shape[0])
+        for start in range(0, candidates.size, step):
+            block = candidates[start:start + step]
+            cx, cy = xs[block, None], ys[block, None]
+
+            # hit[k, j] is True when candidate touch k fell within component j's defined boundaries
+            hit = (cx >= x_min) & (cx <= x_max) & (cy >= y_min) & (cy <= y_max)
+            # argmax picks the first matching column, so the first listed component wins
+            touched[block] = np.where(hit.any(axis=1), hit.argmax(axis=1), -1)
+    return touched
+
+def _hit_test_indexed(xs, ys, spatial_index):
+    """_hit_test_boxes via one bulk R-tree query of all touches as degenerate boxes."""
+    touched = np.full(xs.shape[0], -1, dtype=np.int64)
+    points = np.column_stack((xs, ys)).astype(np.float64)
+    # ids holds each touch's matches back to back, counts[i] of them for touch i
+    ids, counts = spatial_index.intersection_v(points, points)
+    if ids.size:
+        has_hit = counts > 0
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.intp)
+        # The R-tree returns matches unordered; the lowest id is the first listed component
+        touched[has_hit] = np.minimum.reduceat(ids, starts[has_hit])
+    return touched
+
+def _tally_touches(touched, fired, detected_codes, component_codes):
+    """Status bits and counters for hit-tested touches (see _classify_touches_numpy)."""
+    n = touched.shape[0]
+    # Three disjoint classes: outside the extent, inside it but in a gap between boxes (both
+    # dead space), and hits. The mismatch / no-event tests are only evaluated on the hits.
+    hits = np.flatnonzero(touched >= 0)
+    detected = detected_codes[hits]
+    mismatch = (detected != _NO_DETECTED_ID) & (detected != component_codes[touched[hits]])
+    no_event = ~fired[hits]
+
+    status = np.full(n, _OUT_OF_BOUNDS, dtype=np.uint8)
+    # Bool arrays viewed as uint8 are 0/1, so the status bits combine without widening
+    status[hits] = (mismatch.view(np.uint8) << 1) | (no_event.view(np.uint8) << 2)
+
+    counts = np.array(
+        [hits.size, np.count_nonzero(mismatch), np.count_nonzero(no_event), n - hits.size],
+        dtype=np.int64
+    )
+    return counts, touched, status, np.flatnonzero(status)
+
+# Below this many touches the serial kernel beats the parallel kernel's thread dispatch
+_PARALLEL_TOUCH_MIN_SIZE = 50_000
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, inline='always')
+    def _in_box_narrow(x, y, boxes, k):
+        """
+        Branchless point-in-box for int16 layouts: the four edge distances are all non-negative
+        exactly when their bitwise OR has a clear sign bit. Taken in int64 from int16 values,
+        the distances cannot wrap.
+        """
+        x64 = np.int64(x)
+        y64 = np.int64(y)
+        return ((x64 - boxes[k, 0]) | (boxes[k, 2] - x64) | (y64 - boxes[k, 1]) | (boxes[k, 3] - y64)) >= 0
+
+    @njit(cache=True, fastmath=True, inline='always')
+    def _in_box(x, y, boxes, k):
+        """Point-in-box by the four closed compares, which cannot wrap for edges near the int64 limits."""
+        return (x >= boxes[k, 0]) & (x <= boxes[k, 2]) & (y >= boxes[k, 1]) & (y <= boxes[k, 3])
+
+    def _compile_digital_kernels(in_box):
+        """
+        Serial and parallel digital kernels specialized to one point-in-box test. The test is
+        a closure constant, so it is inlined rather than chosen per touch.
+        """
+        @njit(cache=True, fastmath=True, inline='always')
+        def first_box(x, y, x_lo, y_lo, x_hi, y_hi, boxes):
+            """Index of the first box containing (x, y), or -1 for dead space."""
+            # Constant-time reject of touches outside the union extent [x_lo, y_lo, x_hi, y_hi]
+            if x < x_lo or x > x_hi or y < y_lo or y > y_hi:
+                return -1
+            for k in range(boxes.shape[0]):
+                if in_box(x, y, boxes, k):
+                    return k
+            return -1
+
+        @njit(cache=True, fastmath=True)
+        def digital_kernel(xs, ys, fired, detected_codes, boxes, extent, component_codes):
+            """
+            Compiled twin of _classify_touches_numpy. Reads (xs, ys, fired) once and writes the
+            counters, status bits and flagged indices in the same pass, with no temporary masks.
+            """
+            n = xs.shape[0]
+            counts = np.zeros(4, dtype=np.int64)
+            touched = np.full(n, -1, dtype=np.int64)
+            status = np.zeros(n, dtype=np.uint8)
+            flagged = np.empty(n, dtype=np.int64)
+            n_flagged = 0
+
+            x_lo, y_lo, x_hi, y_hi = extent[0], extent[1], extent[2], extent[3]
+
+            for i in range(n):
+                j = first_box(xs[i], ys[i], x_lo, y_lo, x_hi, y_hi, boxes)
+
+                if j < 0:
+                    code = _OUT_OF_BOUNDS
+                    counts[3] += 1
+                else:
+                    touched[i] = j
+                    code = 0
+                    counts[0] += 1
+                    if detected_codes[i] != _NO_DETECTED_ID and detected_codes[i] != component_codes[j]:
+                        code |= _BOUNDARY_MISMATCH
+                        counts[1] += 1
+                    if not fired[i]:
+                        code |= _NO_EVENT_FIRED
+                        counts[2] += 1
+
+                if code:
+                    status[i] = code
+                    flagged[n_flagged] = i
+                    n_flagged += 1
+
+            return counts, touched, status, flagged[:n_flagged]
+
+        @njit(parallel=True, cache=True, fastmath=True)
+        def digital_kernel_parallel(xs, ys, fired, detected_codes, boxes, extent, component_codes):
+            """
+            Multi-core form of _digital_kernel for large batches. Each touch writes only its own
+            touched / status slot and the counters are prange reductions; the flagged indices
+            are left to the caller, as they depend on the order of the touches.
+            """
+            n = xs.shape[0]
+            touched = np.full(n, -1, dtype=np.int64)
+            status = np.empty(n, dtype=np.uint8)
+
+            x_lo, y_lo, x_hi, y_hi = extent[0], extent[1], extent[2], extent[3]
+
+            n_valid = 0
+            n_mismatch = 0
+            n_no_event = 0
+            for i in prange(n):
+                j = first_box(xs[i], ys[i], x_lo, y_lo, x_hi, y_hi, boxes)
+
+                if j < 0:
+                    status[i] = _OUT_OF_BOUNDS
+                else:
+                    touched[i] = j
+                    code = 0
+                    n_valid += 1
+                    if detected_codes[i] != _NO_DETECTED_ID and detected_codes[i] != component_codes[j]:
+                        code |= _BOUNDARY_MISMATCH
+                        n_mismatch += 1
+                    if not fired[i]:
+                        code |= _NO_EVENT_FIRED
+                        n_no_event += 1
+                    status[i] = code
+
+            counts = np.array([n_valid, n_mismatch, n_no_event, n - n_valid], dtype=np.int64)
+            return counts, touched, status
+
+        return digital_kernel, digital_kernel_parallel
+
+    _digital_kernel, _digital_kernel_parallel = _compile_digital_kernels(_in_box)
+    _digital_kernel_narrow, _digital_kernel_parallel_narrow = _compile_digital_kernels(_in_box_narrow)
+
+    def _classify_touches(xs, ys, fired, detected_codes, boxes, extent, component_codes):
+        """_classify_touches_numpy, compiled; large batches are spread across cores."""
+        if xs.dtype == object or boxes.dtype == object:
+            # Coordinates beyond int64 have no native form; compare them exactly in NumPy
+            return _classify_touches_numpy(xs, ys, fired, detected_codes, boxes, extent, component_codes)
+        # int16 boxes are only paired with int16 touches (see _DigitalLayout.boxes_for)
+        if boxes.dtype == np.int16:
+            kernel, kernel_parallel = _digital_kernel_narrow, _digital_kernel_parallel_narrow
+        else:
+            kernel, kernel_parallel = _digital_kernel, _digital_kernel_parallel
+        if xs.shape[0] < _PARALLEL_TOUCH_MIN_SIZE:
+            return kernel(xs, ys, fired, detected_codes, boxes, extent, component_codes)
+        counts, touched, status = kernel_parallel(xs, ys, fired, detected_codes, boxes, extent, component_codes)
+        return counts, touched, status, np.flatnonzero(status)
+else:
+    _classify_touches = _classify_touches_numpy
+
+def _door_distance_sq(ux, uy, dx, dy):
+    """Squared user-to-door distance; elementwise over scalars or NumPy arrays."""
+    ddx = dx - ux
+    ddy = dy - uy
+    return ddx * ddx + ddy * ddy
+
+def _door_approach_dot(ux, uy, vx, vy, dx, dy):
+    """Dot product of velocity and the user-to-door offset (> 0 means approaching)."""
+    return vx * (dx - ux) + vy * (dy - uy)
+
+if vectorize is not None:
+    # Compile the same expressions into native ufuncs, so a batch is one SIMD loop per
+    # quantity with no NumPy temporaries for the intermediate offsets.
+    _door_distance_sq = vectorize(["float64(float64, float64, float64, float64)"], cache=True)(_door_distance_sq)
+    _door_approach_dot = vectorize(
+        ["float64(float64, float64, float64, float64, float64, float64)"], cache=True
+    )(_door_approach_dot)
+
+# Below this many laws a single np.argmin beats the parallel kernel's thread dispatch
+_PARALLEL_ARGMIN_MIN_SIZE = 100_000
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _first_argmin_parallel(values):
+        """Index of the first minimum of a non-empty array, min-reduced across cores."""
+        lowest = values[0]
+        for i in prange(values.shape[0]):
+            lowest = min(lowest, values[i])
+        # Serial scan for the first occurrence keeps np.argmin's tie-breaking
+        for i in range(values.shape[0]):
+            if values[i] == lowest:
+                return i
+        return -1
+
+def _first_argmin(values: np.ndarray) -> int:
+    """Index of the first minimum of a non-empty array."""
+    if njit is not None and values.dtype != object and values.shape[0] >= _PARALLEL_ARGMIN_MIN_SIZE:
+        return int(_first_argmin_parallel(values))
+    return int(values.argmin())
+
+# Directive templates, interned once at module scope rather than rebuilt per directive
+_OUT_OF_BOUNDS_DIRECTIVE = (
+    "Touch #{} at ({}, {}): Touch registered outside all defined component boundaries. "
+    "Directive: **Investigate UI/UX 'Dead Space' or Boundary Definition.**"
+)
+_BOUNDARY_MISMATCH_DIRECTIVE = (
+    "Touch #{} at ({}, {}): Touch was physically within **{}** "
+    "bounds, but application reported detection for **{}**. "
+    "Directive: **Analyze Component Overlap or Event Bubbling/Hit-Testing Logic.**"
+)
+_NO_EVENT_FIRED_DIRECTIVE = (
+    "Touch #{} on component **{}**: "
+    "Boundary hit successful, but no expected event ('{}') fired. "
+    "Directive: **Investigate Software Handler or Event Loop Bug.**"
+)
+_NO_SPEED_LAW_DIRECTIVE = "No specific speed-based legal constraint found for this area."
+
+def _iter_digital_directives(layout: "_DigitalLayout", flagged, flagged_status, flagged_components, xs, ys, detected_ids) -> Iterator[str]:
+    """
+    Yields the directives for the flagged touches (their status bits, the component each hit,
+    and its coordinates), in touch order. detected_ids holds the reported component of each mismatch touch, in order.
+    """
+    component_ids, event_types = layout.component_ids, layout.expected_event_types
+    next_detected_id = iter(detected_ids).__next__
+    # Bound template methods, resolved once per batch rather than per directive
+    format_out_of_bounds = _OUT_OF_BOUNDS_DIRECTIVE.format
+    format_boundary_mismatch = _BOUNDARY_MISMATCH_DIRECTIVE.format
+    format_no_event_fired = _NO_EVENT_FIRED_DIRECTIVE.format
+    for i, code, j, x, y in zip(flagged.tolist(), flagged_status.tolist(), flagged_components.tolist(), xs, ys):
+        # Case 1: Touch occurred outside any defined component area
+        if code & _OUT_OF_BOUNDS:
+            yield format_out_of_bounds(i + 1, x, y)
+            continue
+        # Case 2, Sub-Case A: Boundary Mismatch (Touch was in component A's bounds,
+        # but app logic thought it was component B, or a different component_id was logged)
+        if code & _BOUNDARY_MISMATCH:
+            yield format_boundary_mismatch(i + 1, x, y, component_ids[j], next_detected_id())
+        # Case 2, Sub-Case B: Event Failure (The primary function of AMANDA's example)
+        if code & _NO_EVENT_FIRED:
+            yield format_no_event_fired(i + 1, component_ids[j], event_types[j])
+
+class _LazyDirectives(Sequence):
+    """
+    Read-only list of directive strings that is rendered from its generator on first
+    access. len() is known up front and does not trigger rendering.
+    """
+    __slots__ = ("_pending", "_count", "_items")
+    __hash__ = None
+
+    def __init__(self, pending: Iterator[str], count: int):
+        self._pending = pending
+        self._count = count
+        self._items: Optional[List[str]] = None
+
+    def _materialize(self) -> List[str]:
+        if self._items is None:
+            # list() drains the generator in C with amortized growth; presizing to _count
+            # measured no faster, as the formatting dominates
+            self._items = list(self._pending)
+            self._pending = None
+        return self._items
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialize())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _LazyDirectives):
+            other = other._materialize()
+        return self._materialize() == other
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+# ======================================================================
+# 3. AMANDA Core Logic Class
 # ======================================================================
 
 class AMANDA_Core:
@@ -64,7 +758,8 @@ class AMANDA_Core:
     Autonomous Meta-Data Analysis, Non-Sentient Directive-Based Aggregator.
     Simulates the core analysis and directive generation logic.
     """
-    MPH_TO_MPS = 0.44704
+    MPH_TO_MPS = MPH_TO_MPS
+    DOOR_INTERACTION_RANGE_M = 1.5
 
     def __init__(self):
         print("AMANDA Initialized: Ready for Data Aggregation and Regression.")
@@ -72,73 +767,78 @@ class AMANDA_Core:
     ##
     # Refactored Digital Constraints Analysis 💻
     ##
-    def analyze_digital_constraints(self, data: DigitalConstraintData) -> Dict[str, Any]:
+    def analyze_digital_constraints(self, data: DigitalConstraintData, lazy_directives: bool = False) -> Dict[str, Any]:
         """
         Analyzes user-machine interaction by regressing raw touch data against 
         the application's defined components and expected events.
+
+        With lazy_directives, report["directives"] is a read-only sequence that renders its
+        strings on first access (len() does not), so callers that only read the counters skip
+        the formatting. It is not a list: it cannot be appended to or passed to json.dumps
+        without list() first.
         """
-        
-        # Pre-process component map for quick lookup and boundary checks
-        component_map = {comp.component_id: comp for comp in data.app_components}
-        
-        analysis_report = {
-            "total_touches": len(data.raw_touch_data),
-            "valid_interaction": 0,
-            "boundary_mismatch": 0,
-            "no_event_fired_error": 0,
-            "out_of_bounds_touch": 0,
-            "directives": []
-        }
-        
-        # --- Regression Logic: Analyze each touch event ---
-        for i, touch in enumerate(data.raw_touch_data):
-            x, y = touch['x'], touch['y']
-            event_fired = touch['event_fired']
-            
-            # Find which component's defined boundaries the touch fell within
-            touched_component: Optional[ApplicationComponent] = None
-            
-            for component in data.app_components:
-                xmin, ymin, xmax, ymax = component.bounding_box
-                
-                if xmin <= x <= xmax and ymin <= y <= ymax:
-                    touched_component = component
-                    break
-            
-            # Case 1: Touch occurred outside any defined component area
-            if touched_component is None:
-                analysis_report["out_of_bounds_touch"] += 1
-                analysis_report["directives"].append(
-                    f"Touch #{i+1} at ({x}, {y}): Touch registered outside all defined component boundaries. "
-                    "Directive: **Investigate UI/UX 'Dead Space' or Boundary Definition.**"
-                )
-                continue
-                
-            # Case 2: Touch was valid based on component boundaries
-            analysis_report["valid_interaction"] += 1
-            
-            component_id_detected = touch.get('component_id_detected')
+        # One freshness check and one read of the derived state per analysis
+        state = data._sync_derived()
+        return self._regress_touches(state.layout, state.touches, state.xs, state.ys, state.fired, lazy_directives)
 
-            # Sub-Case A: Check for Boundary Mismatch (Touch was in component A's bounds, 
-            # but app logic thought it was component B, or a different component_id was logged)
-            if component_id_detected and component_id_detected != touched_component.component_id:
-                analysis_report["boundary_mismatch"] += 1
-                analysis_report["directives"].append(
-                    f"Touch #{i+1} at ({x}, {y}): Touch was physically within **{touched_component.component_id}** "
-                    f"bounds, but application reported detection for **{component_id_detected}**. "
-                    "Directive: **Analyze Component Overlap or Event Bubbling/Hit-Testing Logic.**"
-                )
-            
-            # Sub-Case B: Check for Event Failure (The primary function of AMANDA's example)
-            if not event_fired:
-                analysis_report["no_event_fired_error"] += 1
-                analysis_report["directives"].append(
-                    f"Touch #{i+1} on component **{touched_component.component_id}**: "
-                    f"Boundary hit successful, but no expected event ('{touched_component.expected_event_type}') fired. "
-                    "Directive: **Investigate Software Handler or Event Loop Bug.**"
-                )
-            
-        return analysis_report
+    def compile_digital(self, app_components: List[ApplicationComponent], lazy_directives: bool = False) -> Callable[[List[Dict[str, Union[int, str, bool]]]], Dict[str, Any]]:
+        """
+        Specializes the digital analysis to one fixed application layout. The returned
+        function takes raw touch data directly; the layout's bounds, extent and id codes
+        are resolved once here (and cached per layout), so each call only stacks and
+        classifies the touches. lazy_directives is as for analyze_digital_constraints.
+        """
+        layout = _digital_layout(app_components)
+        regress_touches, stack_touches = self._regress_touches, _stack_touches
+
+        def analyze_touches(raw_touch_data: List[Dict[str, Union[int, str, bool]]]) -> Dict[str, Any]:
+            return regress_touches(layout, raw_touch_data, *stack_touches(raw_touch_data), lazy_directives)
+
+        return analyze_touches
+
+    def _regress_touches(self, layout: _DigitalLayout, touches, xs, ys, fired, lazy_directives: bool = False) -> Dict[str, Any]:
+        """Builds the digital report for touches (and their stacked arrays) against a layout."""
+        spatial_index, scan_components = layout.spatial_index, layout.scan_components
+
+        # --- Regression Logic: Analyze every touch event in one vectorized/compiled pass ---
+        detected_codes = layout.detected_codes(touches)
+        # The R-tree compares in float64, so it only answers for touches that convert exactly
+        indexed = spatial_index is not None and _float64_exact(xs) and _float64_exact(ys)
+        if indexed:
+            counts, touched, status, flagged = _classify_touches_indexed(
+                xs, ys, fired, detected_codes, spatial_index, layout.component_codes
+            )
+        else:
+            bounds, extent = layout.boxes_for(xs.dtype)
+            counts, touched, status, flagged = _classify_touches(
+                xs, ys, fired, detected_codes, bounds, extent, layout.scan_codes
+            )
+        valid_interaction, boundary_mismatch, no_event_fired_error, out_of_bounds_touch = counts.tolist()
+
+        flagged_components, flagged_status = touched[flagged], status[flagged]
+        if not indexed and scan_components is not None:
+            # Scan positions back to component indices; dead space stays -1
+            flagged_components = scan_components[flagged_components]
+
+        # Snapshot what the directives quote, so a caller reusing its touch buffer cannot
+        # change a report rendered later
+        detected_ids = []
+        if boundary_mismatch:
+            mismatched = flagged[(flagged_status & _BOUNDARY_MISMATCH) != 0].tolist()
+            detected_ids = [touches[i].get('component_id_detected') for i in mismatched]
+        directives = _iter_digital_directives(
+            layout, flagged, flagged_status, flagged_components, xs[flagged].tolist(), ys[flagged].tolist(), detected_ids
+        )
+        directive_count = boundary_mismatch + no_event_fired_error + out_of_bounds_touch
+
+        return {
+            "total_touches": len(touches),
+            "valid_interaction": valid_interaction,
+            "boundary_mismatch": boundary_mismatch,
+            "no_event_fired_error": no_event_fired_error,
+            "out_of_bounds_touch": out_of_bounds_touch,
+            "directives": _LazyDirectives(directives, directive_count) if lazy_directives else list(directives)
+        }
 
     ##
     # Physical Constraints Analysis (No change needed)
@@ -148,24 +848,28 @@ class AMANDA_Core:
         Analyzes user position and velocity against physical structures 
         to predict an imminent interaction (e.g., reaching a door).
         """
-        DOOR_INTERACTION_RANGE_M = 1.5
+        DOOR_INTERACTION_RANGE_M = self.DOOR_INTERACTION_RANGE_M
         
         ux, uy = data.user_position_m
         vx, vy = data.user_velocity_mps
         dx, dy = data.door_coords_m
         
-        distance_to_door = math.sqrt((dx - ux)**2 + (dy - uy)**2)
+        # Gate on squared distance; the square roots are only taken on the in-range branch
+        ddx, ddy = dx - ux, dy - uy
+        distance_sq = ddx * ddx + ddy * ddy
         
         analysis_report = {
             "prediction": "No imminent door interaction detected.",
             "directive_signal": None
         }
         
-        if distance_to_door < DOOR_INTERACTION_RANGE_M:
-            is_approaching = (vx * (dx - ux) + vy * (dy - uy)) > 0
+        if distance_sq < DOOR_INTERACTION_RANGE_M * DOOR_INTERACTION_RANGE_M:
+            is_approaching = (vx * ddx + vy * ddy) > 0
             
             if is_approaching:
-                time_to_door_sec = distance_to_door / math.sqrt(vx**2 + vy**2) if (vx**2 + vy**2) > 0 else float('inf')
+                distance_to_door = math.sqrt(distance_sq)
+                speed_sq = vx * vx + vy * vy
+                time_to_door_sec = distance_to_door / math.sqrt(speed_sq) if speed_sq > 0 else math.inf
                 
                 analysis_report["prediction"] = (
                     f"User is approaching the door at ({dx:.1f}m, {dy:.1f}m). "
@@ -180,6 +884,63 @@ class AMANDA_Core:
             
         return analysis_report
 
+    def analyze_physical_constraints_batch(self, user_positions_m, user_velocities_mps, door_coords_m) -> Dict[str, Any]:
+        """
+        Vectorized form of analyze_physical_constraints for many (user, door) pairs at once.
+        Takes (N, 2) arrays of positions, velocities and target door coordinates; a single
+        [x, y] pair (e.g. one shared door) is broadcast to every user. Prediction strings are
+        only built for the users with an imminent door interaction.
+        """
+        DOOR_INTERACTION_RANGE_M = self.DOOR_INTERACTION_RANGE_M
+
+        positions, velocities, doors = np.broadcast_arrays(
+            np.asarray(user_positions_m, dtype=np.float64).reshape(-1, 2),
+            np.asarray(user_velocities_mps, dtype=np.float64).reshape(-1, 2),
+            np.asarray(door_coords_m, dtype=np.float64).reshape(-1, 2)
+        )
+
+        ux, uy = positions[:, 0], positions[:, 1]
+        vx, vy = velocities[:, 0], velocities[:, 1]
+        dx, dy = doors[:, 0], doors[:, 1]
+        distance_sq = _door_distance_sq(ux, uy, dx, dy)
+        approach_dot = _door_approach_dot(ux, uy, vx, vy, dx, dy)
+        interaction_mask = (distance_sq < DOOR_INTERACTION_RANGE_M * DOOR_INTERACTION_RANGE_M) & (approach_dot > 0)
+
+        analysis_report = {
+            "total_users": positions.shape[0],
+            "imminent_interactions": int(np.count_nonzero(interaction_mask)),
+            "interaction_mask": interaction_mask,
+            "predictions": {},
+            "directive_signal": None
+        }
+
+        hits = np.flatnonzero(interaction_mask)
+        if hits.size == 0:
+            return analysis_report
+
+        # Distances and times only for the flagged subset, mirroring the scalar gate
+        distance_to_door = np.sqrt(distance_sq[hits])
+        vx_hits, vy_hits = vx[hits], vy[hits]
+        speed_sq = vx_hits * vx_hits + vy_hits * vy_hits
+        with np.errstate(divide='ignore', invalid='ignore'):
+            time_to_door_sec = np.where(speed_sq > 0, distance_to_door / np.sqrt(speed_sq), np.inf)
+
+        predictions = analysis_report["predictions"]
+        for i, (dx, dy), distance, time_sec in zip(
+            hits.tolist(), doors[hits].tolist(), distance_to_door.tolist(), time_to_door_sec.tolist()
+        ):
+            predictions[i] = (
+                f"User is approaching the door at ({dx:.1f}m, {dy:.1f}m). "
+                f"Distance: {distance:.2f}m. Time to door: {time_sec:.2f}s."
+            )
+
+        analysis_report["directive_signal"] = {
+            "device": "Apple Watch",
+            "action": "Haptic/Audio Cue",
+            "message": "Reach out and open the door."
+        }
+        return analysis_report
+
     ##
     # Constitutional Constraints Analysis (No change needed)
     ##
@@ -189,62 +950,58 @@ class AMANDA_Core:
         (U.S. Constitution and derived laws, Texas Constitution and derived laws)
         and generates a pre-emptive warning directive based on the most restrictive law.
         """
-        current_speed_mps = data.vehicle_speed_data_mph * self.MPH_TO_MPS
+        speed_mph = data.vehicle_speed_data_mph
+        proximity_m = data.vehicle_proximity_to_zone_m
+        current_speed_mps = speed_mph * self.MPH_TO_MPS
         decel_mps2 = data.max_safe_decel_mps2
 
         analysis_report = {
-            "current_speed_mph": data.vehicle_speed_data_mph,
+            "current_speed_mph": speed_mph,
             "applied_law": "N/A",
-            "required_limit_mph": float('inf'),
+            "required_limit_mph": math.inf,
             "is_currently_speeding": False,
             "warning_required": False,
             "directives": []
         }
 
-        most_restrictive_law: Optional[BaseConstitutionalLaw] = None
-        min_limit_mph = float('inf')
-
-        for law in data.applicable_laws:
-            if law.speed_limit_mph is not None:
-                if law.speed_limit_mph < min_limit_mph:
-                    min_limit_mph = law.speed_limit_mph
-                    most_restrictive_law = law
-
+        # The most restrictive law is resolved once at construction
+        most_restrictive_law = data.most_restrictive_law
         if most_restrictive_law is None:
-             analysis_report["directives"].append("No specific speed-based legal constraint found for this area.")
+             analysis_report["directives"].append(_NO_SPEED_LAW_DIRECTIVE)
              return analysis_report
         
+        min_limit_mph = most_restrictive_law.speed_limit_mph
         analysis_report["required_limit_mph"] = min_limit_mph
-        analysis_report["applied_law"] = f"Law from {most_restrictive_law.source_constitution} ({most_restrictive_law.law_description})"
-        limit_mps = min_limit_mph * self.MPH_TO_MPS
+        analysis_report["applied_law"] = most_restrictive_law.applied_law
 
         # A. Already Speeding
-        if data.vehicle_speed_data_mph > min_limit_mph:
+        if speed_mph > min_limit_mph:
             analysis_report["is_currently_speeding"] = True
             analysis_report["warning_required"] = True
-            analysis_report["directives"].append(
-                f"Immediate warning: **CURRENTLY EXCEEDING** the {min_limit_mph} MPH limit "
-                f"imposed by {most_restrictive_law.source_constitution} law."
-            )
+            analysis_report["directives"].append(most_restrictive_law.speeding_directive)
             return analysis_report
             
         # B. Pre-emptive Warning Check (Approaching Speeding)
-        elif current_speed_mps > limit_mps * 0.95:
+        elif current_speed_mps > most_restrictive_law.warning_mps:
             
-            distance_to_slow_safely = (limit_mps**2 - current_speed_mps**2) / (2 * -decel_mps2)
+            # The braking distance, in the original operand order: x**2 can round differently
+            # from x * x, and at v == v_limit the negated denominator yields -0.0 (printed "-0.0m")
+            distance_to_slow_safely = (
+                (most_restrictive_law.limit_mps_sq - current_speed_mps**2) / (2 * -decel_mps2)
+            )
             
-            if distance_to_slow_safely >= data.vehicle_proximity_to_zone_m:
+            if distance_to_slow_safely >= proximity_m:
                 analysis_report["warning_required"] = True
                 analysis_report["directives"].append(
-                    f"Warning: Speed is {data.vehicle_speed_data_mph:.1f} MPH. "
+                    f"Warning: Speed is {speed_mph:.1f} MPH. "
                     f"You need {distance_to_slow_safely:.1f}m to slow to the {min_limit_mph} MPH limit. "
-                    f"Zone is {data.vehicle_proximity_to_zone_m:.1f}m away. **SLOW DOWN NOW**."
+                    f"Zone is {proximity_m:.1f}m away. **SLOW DOWN NOW**."
                 )
 
         return analysis_report
 
 # ======================================================================
-# 3. Example Execution
+# 4. Example Execution
 # ======================================================================
 
 amanda = AMANDA_Core()
@@ -1,6 +1,36 @@
 import re
 import json
-from typing import Dict, Any
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import re2
+    # Other packages also install as "re2"; only google-re2's API (re2.Options) is supported
+    if not hasattr(re2, 'Options'):
+        re2 = None
+except ImportError:  # google-re2 is optional; the stdlib re patterns are used without it
+    re2 = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; reports are then serialized with the stdlib json
+    orjson = None
+
+# re's str-pattern \s also matches \v and \x1c-\x1f, which RE2's \s does not; spelled out as
+# classes, the RE2 patterns match re's on all ASCII text
+_RE2_CLASS_ESCAPES = {r"\s": r"[\t\n\v\f\r \x1c-\x1f]", r"\S": r"[^\t\n\v\f\r \x1c-\x1f]"}
+
+def _re2_syntax(pattern: str) -> str:
+    """Rewrites a stdlib pattern's \\s / \\S escapes into their explicit RE2 classes."""
+    # Escapes are matched as pairs, so an escaped backslash followed by "s" is left alone
+    return re.sub(r"\\.", lambda escape: _RE2_CLASS_ESCAPES.get(escape.group(), escape.group()), pattern)
+
+def _dumps(report: Dict[str, Any]) -> str:
+    """Pretty-prints a report as JSON with a 2-space indent (the only width orjson offers)."""
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(report, indent=2)
 
 class AgencyConstraintEngine:
     """
@@ -9,12 +39,26 @@ class AgencyConstraintEngine:
     1. Individual Agency (potential for unlimited action, definition of structure).
     2. Software-Defined Constraints (fixed options, limits, or configuration choices).
     """
+    # Number of distinct inputs whose scan results are kept when caching is enabled
+    SCAN_CACHE_SIZE = 128
+
+    def __init__(self, cache: bool = False):
+        """
+        Args:
+            cache: Keep the scan results of the last SCAN_CACHE_SIZE distinct inputs, so
+                re-analyzing the same data skips the pattern scans. The patterns must not
+                be modified while the cache is in use.
+        """
+        # The identifier classes already list both cases, so they are matched case-sensitively
+        # (no per-character case folding). Spelling out the four non-ASCII letters that
+        # IGNORECASE folds onto ASCII ones (dotted/dotless i, long s, Kelvin sign) keeps the
+        # matches exactly as before.
+        case_folded = "\u0130\u0131\u017f\u212a"
 
-    def __init__(self):
         # Patterns indicative of high Agency (the power to define/create freely)
         self.agency_patterns = {
             "Function/Method Definitions (New Capabilities)": r"(def\s+|class\s+|function\s+)",
-            "Variable Assignments (Mutable State/Freedom)": r"[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*.*",
+            "Variable Assignments (Mutable State/Freedom)": rf"(?-i:[a-zA-Z_{case_folded}][a-zA-Z0-9_{case_folded}]*)\s*=\s*.*",
             "Custom Type Definitions (Structuring Reality)": r"(type\s+|interface\s+|struct\s+)"
         }
 
@@ -25,16 +69,65 @@ class AgencyConstraintEngine:
             "Fixed Conditional Branching (Pre-set Pathways)": r"if\s+\S+\s*in\s*\[.*\]|if\s+\S+\s*==\s*['\"]",
         }
 
-    def _count_matches(self, data: str, patterns: Dict[str, str]) -> Dict[str, int]:
+        # Compile each pattern once (re.IGNORECASE for broader language support)
+        # rather than going through re's pattern cache on every analysis.
+        for patterns in (self.agency_patterns, self.constraint_patterns):
+            for name, pattern in patterns.items():
+                patterns[name] = re.compile(pattern, re.IGNORECASE)
+
+        # None of the patterns need backtracking, so with google-re2 installed each one is
+        # also compiled to an RE2 automaton, keyed by its stdlib pattern.
+        self._re2_patterns = {}
+        if re2 is not None:
+            options = re2.Options()
+            options.case_sensitive = False
+            for patterns in (self.agency_patterns, self.constraint_patterns):
+                for pattern in patterns.values():
+                    self._re2_patterns[pattern] = re2.compile(_re2_syntax(pattern.pattern), options)
+
+        # LRU of scan results keyed by a digest of the data, so cached entries do not keep
+        # the (possibly large) raw text alive
+        self._scan_cache: Optional[OrderedDict] = OrderedDict() if cache else None
+
+    def _count_matches(self, data: str, patterns: Dict[str, re.Pattern]) -> Dict[str, int]:
         """Helper to count occurrences of each pattern in the data."""
         results = {}
+        # The rewritten RE2 patterns match exactly like re on ASCII text; beyond it re's
+        # Unicode \s and case folding differ, so non-ASCII data stays on the stdlib patterns.
+        fast_patterns = self._re2_patterns if data.isascii() else {}
+        # Each pattern gets its own scan: the patterns overlap (e.g. "limit = 5" is both an
+        # assignment and a size limit), so a fused alternation would undercount them.
         for name, pattern in patterns.items():
-            # Use re.IGNORECASE for broader language support
-            matches = re.findall(pattern, data, re.IGNORECASE)
-            # Findall returns groups, so we just count the total number of matches found.
-            results[name] = len(matches)
+            # Count the matches as they are found, without building findall's list of groups.
+            results[name] = sum(1 for _ in fast_patterns.get(pattern, pattern).finditer(data))
         return results
 
+    def _scan(self, data: str) -> Tuple[Dict[str, int], Dict[str, int], int]:
+        """Agency counts, constraint counts and line count of the data, via the cache if enabled."""
+        cache = self._scan_cache
+        if cache is None:
+            return self._scan_uncached(data)
+
+        key = hashlib.blake2b(data.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        scan = cache.get(key)
+        if scan is None:
+            scan = cache[key] = self._scan_uncached(data)
+            if len(cache) > self.SCAN_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return scan
+
+    def _scan_uncached(self, data: str) -> Tuple[Dict[str, int], Dict[str, int], int]:
+        """Runs the pattern scans and the line count over the data."""
+        # splitlines() also breaks on \r, \v, \f, \x1c-\x1e, \x85 and \u2028/9, so a plain
+        # count('\n') would undercount such text.
+        return (
+            self._count_matches(data, self.agency_patterns),
+            self._count_matches(data, self.constraint_patterns),
+            len(data.splitlines())
+        )
+
     def analyze_data(self, raw_data: str) -> Dict[str, Any]:
         """
         Processes the raw data and generates a contextual analysis report.
@@ -45,8 +138,9 @@ class AgencyConstraintEngine:
         Returns:
             A dictionary containing the Agency and Constraint analysis.
         """
-        agency_counts = self._count_matches(raw_data, self.agency_patterns)
-        constraint_counts = self._count_matches(raw_data, self.constraint_patterns)
+        agency_counts, constraint_counts, line_count = self._scan(raw_data)
+        # Fresh dicts per report, as the scan results may be shared through the cache
+        agency_counts, constraint_counts = dict(agency_counts), dict(constraint_counts)
 
         total_agency = sum(agency_counts.values())
         total_constraint = sum(constraint_counts.values())
@@ -77,7 +171,7 @@ class AgencyConstraintEngine:
                 "Indicators_Found": constraint_counts
             },
             # Including the raw data summary for context
-            "Raw_Data_Summary": f"Processed {len(raw_data.splitlines())} lines of data.",
+            "Raw_Data_Summary": f"Processed {line_count} lines of data.",
         }
 
         return report
@@ -117,11 +211,11 @@ if __name__ == '__main__':
 
     print("--- Analysis of CONFIG_DATA (High Constraint) ---")
     config_report = engine.analyze_data(CONFIG_DATA)
-    print(json.dumps(config_report, indent=4))
+    print(_dumps(config_report))
 
     print("\n--- Analysis of MODULE_DATA (High Agency) ---")
     module_report = engine.analyze_data(MODULE_DATA)
-    print(json.dumps(module_report, indent=4))
+    print(_dumps(module_report))
 
     print("\n--- Raw Data Context (CONFIG_DATA) ---")
     print(CONFIG_DATA)